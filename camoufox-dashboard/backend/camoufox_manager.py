@@ -1,29 +1,379 @@
+import asyncio
 import logging
-from dataclasses import asdict
-from typing import Dict, Any, Optional
+import os
+import re
+import time
+import weakref
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Deque, Dict, Any, Iterable, List, MutableMapping, Optional, Set, Tuple
 from datetime import datetime
+from functools import lru_cache
+
+if TYPE_CHECKING:
+    import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Camoufox/BrowserForge are optional at import time so the API can still serve
+# profiles without them; the generator is built once and reused for every launch.
+try:
+    from camoufox import AsyncCamoufox
+    from browserforge.fingerprints import FingerprintGenerator
+    _FP_GEN = FingerprintGenerator()
+    _IMPORT_ERROR: Optional[ImportError] = None
+except ImportError as e:
+    AsyncCamoufox = None
+    _FP_GEN = None
+    _IMPORT_ERROR = e
+
+# Simplified mapping of timezones to approximate (latitude, longitude) coordinates
+_TIMEZONE_COORDS: Dict[str, Tuple[float, float]] = {
+    "GMT-12:00": (-14.2710, -170.1322),  # Baker Island
+    "GMT-11:00": (21.3099, -157.8581),  # Hawaii
+    "GMT-10:00": (61.2181, -149.9003),  # Alaska
+    "GMT-09:00": (37.7749, -122.4194),  # San Francisco
+    "GMT-08:00": (34.0522, -118.2437),  # Los Angeles
+    "GMT-07:00": (39.7392, -104.9903),  # Denver
+    "GMT-06:00": (29.7604, -95.3698),   # Houston
+    "GMT-05:00": (40.7128, -74.0060),   # New York
+    "GMT-04:00": (25.7617, -80.1918),   # Miami
+    "GMT-03:00": (-23.5505, -46.6333),  # São Paulo
+    "GMT-02:00": (-22.9068, -43.1729),  # Rio de Janeiro
+    "GMT-01:00": (32.6612, -16.9244),   # Madeira
+    "GMT+00:00": (51.5074, -0.1278),    # London
+    "GMT+01:00": (52.5200, 13.4050),    # Berlin
+    "GMT+02:00": (59.3293, 18.0686),    # Stockholm
+    "GMT+03:00": (55.7558, 37.6176),    # Moscow
+    "GMT+04:00": (25.2048, 55.2708),    # Dubai
+    "GMT+05:00": (28.6139, 77.2090),    # Delhi
+    "GMT+06:00": (23.8103, 90.4125),    # Dhaka
+    "GMT+07:00": (13.7563, 100.5018),   # Bangkok
+    "GMT+08:00": (39.9042, 116.4074),   # Beijing
+    "GMT+09:00": (35.6762, 139.6503),   # Tokyo
+    "GMT+10:00": (-33.8688, 151.2093),  # Sydney
+    "GMT+11:00": (-37.8136, 144.9631),  # Melbourne
+    "GMT+12:00": (-36.8485, 174.7633),  # Auckland
+}
+_DEFAULT_COORDS: Tuple[float, float] = _TIMEZONE_COORDS["GMT+00:00"]
+
+@lru_cache(maxsize=None)
+def _timezone_arrays() -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """Sorted array form of the timezone table for vectorized lookups"""
+    # numpy is only needed for bulk lookups, so the server doesn't import it at startup
+    import numpy as np
+
+    keys = sorted(_TIMEZONE_COORDS)
+    coords = np.array([_TIMEZONE_COORDS[tz] for tz in keys], dtype=np.float32)
+    return np.array(keys), coords, np.array(_DEFAULT_COORDS, dtype=np.float32)
+
+_GMT_OFFSET_RE = re.compile(r"^GMT([+-])(\d{2}):00$")
+
+# Number of idle, pre-launched browsers kept ready per OS
+WARM_POOL_SIZE = int(os.environ.get("CAMOUFOX_WARM_POOL_SIZE", "2"))
+
+# Number of pre-generated BrowserForge fingerprints kept ready per OS
+FINGERPRINT_POOL_SIZE = int(os.environ.get("CAMOUFOX_FINGERPRINT_POOL_SIZE", "32"))
+
+# Seconds the replenisher waits before retrying after a failed refill
+REPLENISH_RETRY_SECONDS = 5.0
+
+# Number of sessions (each in its own browser context) sharing one browser process.
+# Sessions in one browser share its fingerprint and become linkable, so this
+# defaults to one browser (and fingerprint) per profile.
+CONTEXTS_PER_BROWSER = int(os.environ.get("CAMOUFOX_CONTEXTS_PER_BROWSER", "1"))
+
+# Profile config keys that can be applied per browser context; profiles using
+# anything else need a dedicated browser launched with their exact config
+_CONTEXT_CONFIG_KEYS = {"timezone", "locale:language", "locale:region", "showcursor"}
+
+def _timezone_id_from_offset(timezone: str) -> Optional[str]:
+    """Map a "GMT+HH:00" offset onto the equivalent IANA Etc/GMT zone"""
+    if "/" in timezone:
+        return timezone
+    match = _GMT_OFFSET_RE.match(timezone)
+    if not match:
+        return None
+    sign, hours = match.group(1), int(match.group(2))
+    if hours == 0:
+        return "Etc/GMT"
+    # Etc/GMT zones use POSIX sign conventions, inverted from the GMT offset
+    return f"Etc/GMT{'-' if sign == '+' else '+'}{hours}"
+
+@dataclass
+class FingerprintInfo:
+    """The BrowserForge fingerprint fields shown in the dashboard"""
+    __slots__ = ("user_agent", "platform", "language", "screen_width", "screen_height")
+
+    user_agent: str
+    platform: str
+    language: str
+    screen_width: int
+    screen_height: int
+
+@dataclass
+class BrowserHandle:
+    """A running Camoufox browser and the sessions using it"""
+    __slots__ = ("browser_manager", "browser", "fingerprint_data", "os_key", "shared", "sessions")
+
+    browser_manager: Any
+    browser: Any
+    fingerprint_data: Any
+    os_key: str
+    shared: bool
+    sessions: int
+
+@dataclass
+class SessionRecord:
+    """State tracked for an active browser session"""
+    __slots__ = (
+        "browser", "context", "page", "config",
+        "created_at", "created_monotonic", "fingerprint",
+        "fingerprint_summary", "config_summary",
+    )
+
+    browser: BrowserHandle
+    context: Any
+    page: Any
+    config: Dict[str, Any]
+    created_at: str
+    created_monotonic: float
+    fingerprint: FingerprintInfo
+    # Summaries never change after creation, so they're built once up front
+    fingerprint_summary: Dict[str, Any]
+    config_summary: Dict[str, Any]
+
 class CamoufoxManager:
     """Enhanced Camoufox browser management with advanced fingerprinting"""
     
     def __init__(self):
-        self.active_sessions: Dict[str, Dict[str, Any]] = {}
-        self.session_configs: Dict[str, Dict[str, Any]] = {}
+        self.active_sessions: Dict[str, SessionRecord] = {}
+        self._launching: Set[str] = set()
+        # Weakly held so a profile's lock goes away once nothing is using it
+        self._locks: MutableMapping[str, asyncio.Lock] = weakref.WeakValueDictionary()
+        self._shared_browsers: Dict[str, List[BrowserHandle]] = {}
+        self._os_locks: Dict[str, asyncio.Lock] = {}
+        self._pending_launches: Dict[str, asyncio.Future] = {}
+        self._warm_pools: Dict[str, asyncio.Queue] = {}
+        self._fingerprint_pools: Dict[str, Deque[Any]] = defaultdict(deque)
+        self._replenish_wakeup: Optional[asyncio.Event] = None
+        self._replenish_task: Optional[asyncio.Task] = None
+    
+    async def start(self, os_names: Iterable[str] = ()):
+        """Start keeping fingerprints and pre-launched browsers ready for the given OSes"""
+        if AsyncCamoufox is None or _FP_GEN is None:
+            return
+        for os_name in os_names:
+            self._warm_pool_for(self._os_key(os_name))
+        self._replenish_wakeup = asyncio.Event()
+        self._replenish_task = asyncio.create_task(self._replenish_loop())
+    
+    async def shutdown(self):
+        """Stop the warm pool and close any idle browsers"""
+        if self._replenish_task is not None:
+            self._replenish_task.cancel()
+            try:
+                await self._replenish_task
+            except asyncio.CancelledError:
+                pass
+            self._replenish_task = None
+        for pool in self._warm_pools.values():
+            while not pool.empty():
+                await self._close_browser(pool.get_nowait())
+    
+    def _os_key(self, os_name: str) -> str:
+        """Normalize a profile OS name to the key Camoufox expects"""
+        return os_name.lower() if os_name else "windows"
+    
+    def _lock_for(self, profile_id: str) -> asyncio.Lock:
+        """Get the lock guarding session bookkeeping for a profile"""
+        lock = self._locks.get(profile_id)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[profile_id] = lock
+        return lock
+    
+    def _os_lock_for(self, os_key: str) -> asyncio.Lock:
+        """Get the lock guarding the shared browsers for an OS"""
+        lock = self._os_locks.get(os_key)
+        if lock is None:
+            lock = self._os_locks[os_key] = asyncio.Lock()
+        return lock
+    
+    def _warm_pool_for(self, os_key: str) -> asyncio.Queue:
+        """Get the warm pool for an OS, registering the OS for replenishment"""
+        pool = self._warm_pools.get(os_key)
+        if pool is None:
+            pool = self._warm_pools[os_key] = asyncio.Queue()
+        return pool
+    
+    async def _launch_browser(
+        self,
+        os_key: str,
+        config: Optional[Dict[str, Any]] = None,
+        headless: bool = False,
+        humanize: Any = True,
+        notify: bool = True,
+    ) -> BrowserHandle:
+        """Launch a Camoufox browser; without a config it only carries OS-level settings"""
+        fingerprint_data = self._next_fingerprint(os_key, notify=notify)
+        browser_manager = AsyncCamoufox(
+            config=config if config is not None else {"showcursor": True},
+            fingerprint=fingerprint_data,
+            os=os_key,
+            headless=headless,
+            humanize=humanize,
+            i_know_what_im_doing=True,
+        )
+        browser = await browser_manager.__aenter__()
+        return BrowserHandle(
+            browser_manager=browser_manager,
+            browser=browser,
+            fingerprint_data=fingerprint_data,
+            os_key=os_key,
+            shared=config is None,
+            sessions=0,
+        )
+    
+    async def _close_browser(self, handle: BrowserHandle):
+        """Shut down a browser process"""
+        try:
+            await handle.browser_manager.__aexit__(None, None, None)
+        except Exception as e:
+            logger.error(f"Error closing {handle.os_key} browser: {e}")
+    
+    def _next_fingerprint(self, os_key: str, notify: bool = True) -> Any:
+        """Draw a pre-generated fingerprint for the OS, generating one on a miss"""
+        self._warm_pool_for(os_key)
+        # The replenisher's own draws must not wake it, or it never goes idle
+        if notify and self._replenish_wakeup is not None:
+            self._replenish_wakeup.set()
+        fingerprints = self._fingerprint_pools[os_key]
+        if fingerprints:
+            return fingerprints.popleft()
+        # Generate enhanced fingerprint using BrowserForge
+        return _FP_GEN.generate(os=os_key)
+    
+    async def _replenish_loop(self):
+        """Refill fingerprint and warm pools in the background as they're drawn from"""
+        while True:
+            self._replenish_wakeup.clear()
+            failed = False
+            for os_key, pool in list(self._warm_pools.items()):
+                while pool.qsize() < WARM_POOL_SIZE:
+                    try:
+                        pool.put_nowait(await self._launch_browser(os_key, notify=False))
+                    except Exception as e:
+                        logger.error(f"Error pre-launching {os_key} browser: {e}")
+                        failed = True
+                        break
+            # Top up fingerprints last so draws by the launches above are replaced
+            for os_key in list(self._warm_pools):
+                fingerprints = self._fingerprint_pools[os_key]
+                while len(fingerprints) < FINGERPRINT_POOL_SIZE:
+                    try:
+                        fingerprints.append(_FP_GEN.generate(os=os_key))
+                    except Exception as e:
+                        logger.error(f"Error generating {os_key} fingerprint: {e}")
+                        failed = True
+                        break
+                    await asyncio.sleep(0)  # Let requests run between samples
+            if failed:
+                # Back off so a persistent failure doesn't spin the event loop
+                await asyncio.sleep(REPLENISH_RETRY_SECONDS)
+                continue
+            await self._replenish_wakeup.wait()
+    
+    def _take_warm_browser(self, os_key: str) -> Optional[BrowserHandle]:
+        """Take an idle browser from the warm pool, if one is ready"""
+        if self._replenish_wakeup is None:
+            return None
+        pool = self._warm_pool_for(os_key)
+        self._replenish_wakeup.set()
+        try:
+            return pool.get_nowait()
+        except asyncio.QueueEmpty:
+            return None
+    
+    async def _acquire_shared_browser(self, os_key: str) -> BrowserHandle:
+        """Get a shared browser for the OS with room for another session"""
+        if CONTEXTS_PER_BROWSER <= 1:
+            # Nothing to share, so each session simply owns its browser
+            handle = self._take_warm_browser(os_key) or await self._launch_browser(os_key)
+            handle.shared = False
+            handle.sessions = 1
+            return handle
+        
+        lock = self._os_lock_for(os_key)
+        while True:
+            async with lock:
+                browsers = self._shared_browsers.setdefault(os_key, [])
+                for handle in browsers:
+                    if handle.sessions < CONTEXTS_PER_BROWSER:
+                        handle.sessions += 1
+                        return handle
+                pending = self._pending_launches.get(os_key)
+                if pending is None:
+                    # No room anywhere: this caller launches the next browser
+                    pending = asyncio.get_running_loop().create_future()
+                    self._pending_launches[os_key] = pending
+                    break
+            # Another caller is already launching one; wait for it and look again.
+            # asyncio.wait doesn't cancel the shared future if this caller is cancelled.
+            await asyncio.wait([pending])
+        
+        # Launch outside the lock so other OSes and dedicated launches aren't held up
+        try:
+            handle = self._take_warm_browser(os_key) or await self._launch_browser(os_key)
+            async with lock:
+                handle.sessions = 1
+                browsers.append(handle)
+            return handle
+        finally:
+            del self._pending_launches[os_key]
+            pending.set_result(None)
+    
+    async def _release_browser(self, handle: BrowserHandle):
+        """Drop a session's hold on its browser, retiring the browser once unused"""
+        if handle.shared:
+            async with self._os_lock_for(handle.os_key):
+                handle.sessions -= 1
+                if handle.sessions > 0:
+                    return
+                self._shared_browsers[handle.os_key].remove(handle)
+        # Never recycle a used browser: its fingerprint must not pass to another profile
+        await self._close_browser(handle)
+    
+    def _context_options(self, config: Dict[str, Any]) -> Dict[str, Any]:
+        """Build Playwright context options applying the profile's locale and timezone"""
+        options: Dict[str, Any] = {}
+        language = config.get("locale:language")
+        if language:
+            region = config.get("locale:region")
+            options["locale"] = f"{language}-{region}" if region else language
+        timezone = config.get("timezone")
+        if timezone:
+            timezone_id = _timezone_id_from_offset(timezone)
+            if timezone_id:
+                options["timezone_id"] = timezone_id
+        return options
         
     async def create_browser_session(self, profile_id: str, config: Dict[str, Any], os_name: str) -> bool:
         """Create a new Camoufox browser session with advanced fingerprinting"""
+        if AsyncCamoufox is None or _FP_GEN is None:
+            logger.error(f"Camoufox or BrowserForge not available: {_IMPORT_ERROR}")
+            return False
+        
+        lock = self._lock_for(profile_id)
+        # Reserve the profile so concurrent launches can't spawn a second browser.
+        # The lock only covers bookkeeping, not the (slow) browser startup.
+        async with lock:
+            if profile_id in self.active_sessions or profile_id in self._launching:
+                logger.warning(f"Browser session already active for profile {profile_id}")
+                return False
+            self._launching.add(profile_id)
+        
         try:
-            # Import Camoufox modules
-            from camoufox import AsyncCamoufox
-            from browserforge.fingerprints import FingerprintGenerator
-            
-            # Generate enhanced fingerprint using BrowserForge
-            generator = FingerprintGenerator()
-            fingerprint_data = generator.generate()
-            fingerprint: Dict[str, Any] = asdict(fingerprint_data)
-            
             base_config = config.copy()
             base_config.pop("os", None)
             humanize_option = base_config.pop("humanize", True)
@@ -31,21 +381,28 @@ class CamoufoxManager:
             # Ensure pointer feedback for interactive sessions
             if not base_config.get("showcursor", True):
                 base_config["showcursor"] = True
-            os_key = os_name.lower() if os_name else "windows"
+            os_key = self._os_key(os_name)
             
-            browser_manager = AsyncCamoufox(
-                config=base_config,
-                fingerprint=fingerprint_data,
-                os=os_key,
-                headless=headless_option,
-                humanize=humanize_option,
-                i_know_what_im_doing=True,
-            )
-            browser = await browser_manager.__aenter__()
+            # Profiles with default launch options share a browser per OS and
+            # get their own context; anything else needs a dedicated browser
+            if humanize_option is True and not headless_option and base_config.keys() <= _CONTEXT_CONFIG_KEYS:
+                handle = await self._acquire_shared_browser(os_key)
+            else:
+                handle = await self._launch_browser(
+                    os_key, base_config, headless=headless_option, humanize=humanize_option
+                )
+                handle.sessions = 1
             
-            # Create a new page
-            page = await browser.new_page()
-            await page.bring_to_front()  # Ensure the new window is focused for user input
+            try:
+                # Create a new page in a private context; both launch paths get the
+                # same locale and timezone settings
+                context = await handle.browser.new_context(**self._context_options(base_config))
+                page = await context.new_page()
+                await page.bring_to_front()  # Ensure the new window is focused for user input
+            except Exception:
+                await self._release_browser(handle)
+                raise
+            fingerprint = self._extract_fingerprint(handle.fingerprint_data)
             session_config = {
                 **base_config,
                 "os": os_name,
@@ -54,43 +411,43 @@ class CamoufoxManager:
             }
             
             # Store session information
-            self.active_sessions[profile_id] = {
-                "browser_manager": browser_manager,
-                "browser": browser,
-                "page": page,
-                "config": session_config,
-                "created_at": datetime.now().isoformat(),
-                "fingerprint": fingerprint
-            }
-            
-            self.session_configs[profile_id] = session_config
+            async with lock:
+                self.active_sessions[profile_id] = SessionRecord(
+                    browser=handle,
+                    context=context,
+                    page=page,
+                    config=session_config,
+                    created_at=datetime.now().isoformat(),
+                    created_monotonic=time.monotonic(),
+                    fingerprint=fingerprint,
+                    fingerprint_summary=self._get_fingerprint_summary(fingerprint),
+                    config_summary=self._get_config_summary(session_config),
+                )
             
             logger.info(f"Browser session created for profile {profile_id}")
             return True
             
-        except ImportError as e:
-            logger.error(f"Camoufox or BrowserForge not available: {e}")
-            return False
         except Exception as e:
             logger.error(f"Error creating browser session for profile {profile_id}: {e}")
             return False
+        finally:
+            self._launching.discard(profile_id)
     
     async def close_browser_session(self, profile_id: str) -> bool:
         """Close a browser session"""
         try:
-            if profile_id not in self.active_sessions:
+            async with self._lock_for(profile_id):
+                # Remove from active sessions before the slow shutdown so the
+                # profile can't be closed twice
+                session = self.active_sessions.pop(profile_id, None)
+            if session is None:
                 return False
-                
-            session = self.active_sessions[profile_id]
-            browser_manager = session["browser_manager"]
             
-            # Close the browser
-            await browser_manager.__aexit__(None, None, None)
-            
-            # Remove from active sessions
-            del self.active_sessions[profile_id]
-            if profile_id in self.session_configs:
-                del self.session_configs[profile_id]
+            # Close the session's context, and its browser once no session uses it
+            try:
+                await session.context.close()
+            finally:
+                await self._release_browser(session.browser)
             
             logger.info(f"Browser session closed for profile {profile_id}")
             return True
@@ -101,16 +458,19 @@ class CamoufoxManager:
     
     def get_session_info(self, profile_id: str) -> Optional[Dict[str, Any]]:
         """Get information about an active session"""
-        if profile_id not in self.active_sessions:
+        session = self.active_sessions.get(profile_id)
+        if session is None:
             return None
-            
-        session = self.active_sessions[profile_id]
+        return self._session_info(profile_id, session)
+    
+    def _session_info(self, profile_id: str, session: SessionRecord) -> Dict[str, Any]:
+        """Build the public view of a session record"""
         return {
             "profile_id": profile_id,
-            "created_at": session["created_at"],
-            "uptime": (datetime.now() - datetime.fromisoformat(session["created_at"])).total_seconds(),
-            "fingerprint_summary": self._get_fingerprint_summary(session["fingerprint"]),
-            "config_summary": self._get_config_summary(session["config"])
+            "created_at": session.created_at,
+            "uptime": time.monotonic() - session.created_monotonic,
+            "fingerprint_summary": session.fingerprint_summary,
+            "config_summary": session.config_summary
         }
     
     def is_session_active(self, profile_id: str) -> bool:
@@ -119,23 +479,19 @@ class CamoufoxManager:
     
     def get_active_sessions(self) -> Dict[str, Dict[str, Any]]:
         """Get all active sessions"""
-        sessions: Dict[str, Dict[str, Any]] = {}
-        for profile_id in self.active_sessions:
-            session_info = self.get_session_info(profile_id)
-            if session_info is not None:
-                sessions[profile_id] = session_info
-        return sessions
+        return {
+            profile_id: self._session_info(profile_id, session)
+            for profile_id, session in self.active_sessions.items()
+        }
     
     async def navigate_to_url(self, profile_id: str, url: str) -> bool:
         """Navigate to a URL in the specified profile's browser"""
         try:
-            if profile_id not in self.active_sessions:
+            session = self.active_sessions.get(profile_id)
+            if session is None:
                 return False
                 
-            session = self.active_sessions[profile_id]
-            page = session["page"]
-            
-            await page.goto(url)
+            await session.page.goto(url)
             logger.info(f"Navigated to {url} in profile {profile_id}")
             return True
             
@@ -145,52 +501,41 @@ class CamoufoxManager:
     
     def _get_geolocation_from_timezone(self, timezone: str) -> Dict[str, float]:
         """Get approximate geolocation based on timezone"""
-        # Simplified mapping of timezones to approximate coordinates
-        timezone_coords = {
-            "GMT-12:00": {"latitude": -14.2710, "longitude": -170.1322},  # Baker Island
-            "GMT-11:00": {"latitude": 21.3099, "longitude": -157.8581},   # Hawaii
-            "GMT-10:00": {"latitude": 61.2181, "longitude": -149.9003},   # Alaska
-            "GMT-09:00": {"latitude": 37.7749, "longitude": -122.4194},   # San Francisco
-            "GMT-08:00": {"latitude": 34.0522, "longitude": -118.2437},   # Los Angeles
-            "GMT-07:00": {"latitude": 39.7392, "longitude": -104.9903},   # Denver
-            "GMT-06:00": {"latitude": 29.7604, "longitude": -95.3698},    # Houston
-            "GMT-05:00": {"latitude": 40.7128, "longitude": -74.0060},    # New York
-            "GMT-04:00": {"latitude": 25.7617, "longitude": -80.1918},    # Miami
-            "GMT-03:00": {"latitude": -23.5505, "longitude": -46.6333},   # São Paulo
-            "GMT-02:00": {"latitude": -22.9068, "longitude": -43.1729},   # Rio de Janeiro
-            "GMT-01:00": {"latitude": 32.6612, "longitude": -16.9244},    # Madeira
-            "GMT+00:00": {"latitude": 51.5074, "longitude": -0.1278},     # London
-            "GMT+01:00": {"latitude": 52.5200, "longitude": 13.4050},     # Berlin
-            "GMT+02:00": {"latitude": 59.3293, "longitude": 18.0686},     # Stockholm
-            "GMT+03:00": {"latitude": 55.7558, "longitude": 37.6176},     # Moscow
-            "GMT+04:00": {"latitude": 25.2048, "longitude": 55.2708},     # Dubai
-            "GMT+05:00": {"latitude": 28.6139, "longitude": 77.2090},     # Delhi
-            "GMT+06:00": {"latitude": 23.8103, "longitude": 90.4125},     # Dhaka
-            "GMT+07:00": {"latitude": 13.7563, "longitude": 100.5018},    # Bangkok
-            "GMT+08:00": {"latitude": 39.9042, "longitude": 116.4074},    # Beijing
-            "GMT+09:00": {"latitude": 35.6762, "longitude": 139.6503},    # Tokyo
-            "GMT+10:00": {"latitude": -33.8688, "longitude": 151.2093},   # Sydney
-            "GMT+11:00": {"latitude": -37.8136, "longitude": 144.9631},   # Melbourne
-            "GMT+12:00": {"latitude": -36.8485, "longitude": 174.7633},   # Auckland
-        }
-        
-        return timezone_coords.get(timezone, {"latitude": 51.5074, "longitude": -0.1278})
+        latitude, longitude = _TIMEZONE_COORDS.get(timezone, _DEFAULT_COORDS)
+        return {"latitude": latitude, "longitude": longitude}
     
-    def _get_fingerprint_summary(self, fingerprint: Dict[str, Any]) -> Dict[str, Any]:
+    def geolocations_for_timezones(self, timezones: List[str]) -> "np.ndarray":
+        """Get approximate (latitude, longitude) rows for many timezones at once"""
+        import numpy as np
+
+        keys, coords, default = _timezone_arrays()
+        tz = np.asarray(timezones, dtype=str)
+        idx = np.minimum(np.searchsorted(keys, tz), len(keys) - 1)
+        found = keys[idx] == tz
+        # Unknown timezones fall back to the same default as the single lookup
+        return np.where(found[:, None], coords[idx], default)
+    
+    def _extract_fingerprint(self, fingerprint_data: Any) -> FingerprintInfo:
+        """Pull the fields shown in the dashboard out of a BrowserForge fingerprint"""
+        # Only these fields are read, so skip a full asdict() copy of the fingerprint
+        navigator = fingerprint_data.navigator
+        screen = fingerprint_data.screen
+        return FingerprintInfo(
+            user_agent=navigator.userAgent,
+            platform=navigator.platform,
+            language=navigator.language,
+            screen_width=screen.width,
+            screen_height=screen.height,
+        )
+    
+    def _get_fingerprint_summary(self, fingerprint: FingerprintInfo) -> Dict[str, Any]:
         """Get a summary of the fingerprint for display"""
-        summary = {}
-        
-        if "navigator" in fingerprint:
-            nav = fingerprint["navigator"]
-            summary["user_agent"] = nav.get("userAgent", "Unknown")
-            summary["platform"] = nav.get("platform", "Unknown")
-            summary["language"] = nav.get("language", "Unknown")
-        
-        if "screen" in fingerprint:
-            screen = fingerprint["screen"]
-            summary["screen_resolution"] = f"{screen.get('width', 0)}x{screen.get('height', 0)}"
-        
-        return summary
+        return {
+            "user_agent": fingerprint.user_agent or "Unknown",
+            "platform": fingerprint.platform or "Unknown",
+            "language": fingerprint.language or "Unknown",
+            "screen_resolution": f"{fingerprint.screen_width or 0}x{fingerprint.screen_height or 0}",
+        }
     
     def _get_config_summary(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Get a summary of the configuration for display"""
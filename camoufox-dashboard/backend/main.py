@@ -1,18 +1,21 @@
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
-from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
-import json
+from pydantic import BaseModel, TypeAdapter
+from typing import List, Optional, Dict, Any, Set
 import os
+import sys
 import uuid
 import asyncio
 from datetime import datetime
 import logging
+from contextlib import asynccontextmanager
+import aiofiles
+import orjson
 from camoufox_manager import CamoufoxManager
 
 # Ensure Windows event loop supports subprocesses (required by Playwright).
-if os.name == "nt":
+# Proactor is already the default on Windows from Python 3.8 onwards.
+if os.name == "nt" and sys.version_info < (3, 8):
     try:
         asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
     except AttributeError:
@@ -24,7 +27,13 @@ if os.name == "nt":
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Camoufox Dashboard API", version="1.0.0")
+# Delay before writing profiles.json so bursts of changes collapse into one write
+SAVE_DEBOUNCE_SECONDS = 0.2
+
+# Number of browser launches allowed to run at once; stops are never throttled
+MAX_BROWSER_WORKERS = int(
+    os.environ.get("CAMOUFOX_MAX_BROWSER_WORKERS", str(min(4, os.cpu_count() or 1)))
+)
 
 # Data models
 class ProfileCreate(BaseModel):
@@ -41,33 +50,111 @@ class Profile(BaseModel):
     created_at: str
     config: Optional[Dict[str, Any]] = None
 
+# Validates the whole profiles file in one pass
+ProfileList = TypeAdapter(List[Profile])
+
 class ProfileManager:
     def __init__(self):
         self.profiles_file = "profiles.json"
         self.camoufox_manager = CamoufoxManager()  # Enhanced Camoufox manager
+        self._dirty: Optional[asyncio.Event] = None
+        self._save_task: Optional[asyncio.Task] = None
+        self._launch_jobs: Optional[asyncio.Queue] = None
+        self._launch_workers: List[asyncio.Task] = []
+        self._stop_tasks: Set[asyncio.Task] = set()
         self.load_profiles()
 
+    async def start(self):
+        """Start background persistence, launch workers and pre-launching"""
+        self._dirty = asyncio.Event()
+        self._save_task = asyncio.create_task(self._save_loop())
+        self._launch_jobs = asyncio.Queue()
+        self._launch_workers = [
+            asyncio.create_task(self._launch_worker()) for _ in range(max(1, MAX_BROWSER_WORKERS))
+        ]
+        await self.camoufox_manager.start({profile.os for profile in self.profiles})
+
+    async def shutdown(self):
+        """Stop background tasks and flush any pending changes"""
+        for worker in self._launch_workers:
+            worker.cancel()
+        await asyncio.gather(*self._launch_workers, return_exceptions=True)
+        self._launch_workers = []
+        # Let in-flight stops finish so their browsers are actually closed
+        await asyncio.gather(*self._stop_tasks, return_exceptions=True)
+        await self.camoufox_manager.shutdown()
+        if self._save_task is not None:
+            self._save_task.cancel()
+            try:
+                await self._save_task
+            except asyncio.CancelledError:
+                pass
+            self._save_task = None
+        # Always write once more: cancelling the save loop mid-write can leave
+        # the file truncated after the dirty flag was already cleared
+        self._dirty = None
+        self.save_profiles_now()
+
     def load_profiles(self):
         """Load profiles from JSON file"""
         try:
             if os.path.exists(self.profiles_file):
-                with open(self.profiles_file, 'r') as f:
-                    data = json.load(f)
-                    self.profiles = [Profile(**profile) for profile in data]
+                with open(self.profiles_file, 'rb') as f:
+                    self.profiles = ProfileList.validate_json(f.read())
             else:
                 self.profiles = []
         except Exception as e:
             logger.error(f"Error loading profiles: {e}")
             self.profiles = []
+        # Index by ID so lookups don't scan the whole list
+        self._profiles_by_id: Dict[str, Profile] = {p.id: p for p in self.profiles}
+        # JSON-ready dump of each profile, refreshed only when that profile changes
+        self._serialized: Dict[str, Dict[str, Any]] = {
+            p.id: p.model_dump(mode="json") for p in self.profiles
+        }
+
+    def _dump_profiles(self) -> bytes:
+        """Serialize the cached profile dumps in list order"""
+        return orjson.dumps(
+            [self._serialized[profile.id] for profile in self.profiles],
+            option=orjson.OPT_INDENT_2,
+        )
 
-    def save_profiles(self):
+    async def save_profiles(self):
         """Save profiles to JSON file"""
         try:
-            with open(self.profiles_file, 'w') as f:
-                json.dump([profile.dict() for profile in self.profiles], f, indent=2)
+            data = self._dump_profiles()
+            async with aiofiles.open(self.profiles_file, 'wb') as f:
+                await f.write(data)
         except Exception as e:
             logger.error(f"Error saving profiles: {e}")
 
+    def save_profiles_now(self):
+        """Save profiles to JSON file synchronously"""
+        try:
+            with open(self.profiles_file, 'wb') as f:
+                f.write(self._dump_profiles())
+        except Exception as e:
+            logger.error(f"Error saving profiles: {e}")
+
+    def mark_dirty(self, profile: Optional[Profile] = None):
+        """Schedule a write of the profiles file, refreshing a changed profile's dump"""
+        if profile is not None:
+            self._serialized[profile.id] = profile.model_dump(mode="json")
+        if self._dirty is not None:
+            self._dirty.set()
+        else:
+            # Background saving only runs within the app lifespan; write directly otherwise
+            self.save_profiles_now()
+
+    async def _save_loop(self):
+        """Coalesce bursts of profile changes into a single write"""
+        while True:
+            await self._dirty.wait()
+            await asyncio.sleep(SAVE_DEBOUNCE_SECONDS)
+            self._dirty.clear()
+            await self.save_profiles()
+
     def create_profile(self, profile_data: ProfileCreate) -> Profile:
         """Create a new profile"""
         profile_id = str(uuid.uuid4())
@@ -86,7 +173,8 @@ class ProfileManager:
         )
         
         self.profiles.append(profile)
-        self.save_profiles()
+        self._profiles_by_id[profile.id] = profile
+        self.mark_dirty(profile)
         return profile
 
     def get_profiles(self) -> List[Profile]:
@@ -95,22 +183,44 @@ class ProfileManager:
 
     def get_profile(self, profile_id: str) -> Optional[Profile]:
         """Get a specific profile by ID"""
-        for profile in self.profiles:
-            if profile.id == profile_id:
-                return profile
-        return None
+        return self._profiles_by_id.get(profile_id)
 
-    def delete_profile(self, profile_id: str) -> bool:
+    async def delete_profile(self, profile_id: str) -> bool:
         """Delete a profile"""
-        # Stop browser if active
+        # Stop browser if active; stop_browser logs any failure to close it
         if self.camoufox_manager.is_session_active(profile_id):
-            asyncio.create_task(self.camoufox_manager.close_browser_session(profile_id))
+            await self.enqueue_browser_job("stop", profile_id)
         
         # Remove from profiles list
-        self.profiles = [p for p in self.profiles if p.id != profile_id]
-        self.save_profiles()
+        profile = self._profiles_by_id.pop(profile_id, None)
+        if profile is not None:
+            self.profiles.remove(profile)
+            self._serialized.pop(profile_id, None)
+        self.mark_dirty()
         return True
 
+    async def enqueue_browser_job(self, action: str, profile_id: str):
+        """Queue a "launch" for the bounded workers, or start a "stop" right away"""
+        if action == "launch":
+            await self._launch_jobs.put(profile_id)
+        elif action == "stop":
+            # Stops free the resources the launch bound protects, so they never
+            # wait behind queued launches
+            task = asyncio.create_task(self.stop_browser(profile_id))
+            self._stop_tasks.add(task)
+            task.add_done_callback(self._stop_tasks.discard)
+        else:
+            raise ValueError(f"Unknown browser job {action!r}")
+
+    async def _launch_worker(self):
+        """Run queued launches one at a time"""
+        while True:
+            profile_id = await self._launch_jobs.get()
+            try:
+                await self.launch_browser(profile_id)
+            finally:
+                self._launch_jobs.task_done()
+
     def generate_camoufox_config(self, os: str, timezone: str) -> Dict[str, Any]:
         """Generate baseline Camoufox configuration based on OS and timezone."""
         return {
@@ -146,7 +256,7 @@ class ProfileManager:
             if success:
                 # Update profile status
                 profile.status = "active"
-                self.save_profiles()
+                self.mark_dirty(profile)
                 logger.info(f"Browser launched for profile {profile.name} ({profile_id})")
             
             return success
@@ -165,7 +275,7 @@ class ProfileManager:
                 profile = self.get_profile(profile_id)
                 if profile:
                     profile.status = "inactive"
-                    self.save_profiles()
+                    self.mark_dirty(profile)
                 logger.info(f"Browser stopped for profile {profile_id}")
             
             return success
@@ -177,6 +287,18 @@ class ProfileManager:
 # Initialize profile manager
 profile_manager = ProfileManager()
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run background persistence and browser pre-launching for the app's lifetime"""
+    await profile_manager.start()
+    try:
+        yield
+    finally:
+        # Close idle browsers and flush pending profile changes to disk
+        await profile_manager.shutdown()
+
+app = FastAPI(title="Camoufox Dashboard API", version="1.0.0", lifespan=lifespan)
+
 # API Routes
 @app.get("/api/profiles", response_model=List[Profile])
 async def get_profiles():
@@ -208,14 +330,14 @@ async def delete_profile(profile_id: str):
     if not profile:
         raise HTTPException(status_code=404, detail="Profile not found")
     
-    success = profile_manager.delete_profile(profile_id)
+    success = await profile_manager.delete_profile(profile_id)
     if success:
         return {"message": "Profile deleted successfully"}
     else:
         raise HTTPException(status_code=500, detail="Failed to delete profile")
 
-@app.post("/api/profiles/{profile_id}/launch")
-async def launch_profile(profile_id: str, background_tasks: BackgroundTasks):
+@app.post("/api/profiles/{profile_id}/launch", status_code=202)
+async def launch_profile(profile_id: str):
     """Launch a browser instance for the profile"""
     profile = profile_manager.get_profile(profile_id)
     if not profile:
@@ -225,12 +347,12 @@ async def launch_profile(profile_id: str, background_tasks: BackgroundTasks):
         raise HTTPException(status_code=400, detail="Profile is already active")
     
     # Launch browser in background
-    background_tasks.add_task(profile_manager.launch_browser, profile_id)
+    await profile_manager.enqueue_browser_job("launch", profile_id)
     
     return {"message": "Browser launch initiated"}
 
-@app.post("/api/profiles/{profile_id}/stop")
-async def stop_profile(profile_id: str, background_tasks: BackgroundTasks):
+@app.post("/api/profiles/{profile_id}/stop", status_code=202)
+async def stop_profile(profile_id: str):
     """Stop a browser instance for the profile"""
     profile = profile_manager.get_profile(profile_id)
     if not profile:
@@ -240,7 +362,7 @@ async def stop_profile(profile_id: str, background_tasks: BackgroundTasks):
         raise HTTPException(status_code=400, detail="Profile is not active")
     
     # Stop browser in background
-    background_tasks.add_task(profile_manager.stop_browser, profile_id)
+    await profile_manager.enqueue_browser_job("stop", profile_id)
     
     return {"message": "Browser stop initiated"}
 
@@ -280,19 +402,6 @@ async def test_profile_browser(profile_id: str):
         logger.error(f"Browser test error: {e}")
         raise HTTPException(status_code=500, detail=f"Browser test failed: {str(e)}")
 
-# Serve static files (frontend)
-app.mount("/static", StaticFiles(directory="../frontend"), name="static")
-
-@app.get("/")
-async def serve_frontend():
-    """Serve the frontend HTML file"""
-    return FileResponse("../frontend/index.html")
-
-@app.get("/app.js")
-async def serve_js():
-    """Serve the JavaScript file"""
-    return FileResponse("../frontend/app.js")
-
 # Health check endpoint
 @app.get("/health")
 async def health_check():
@@ -327,6 +436,17 @@ async def get_active_sessions():
     """Get all active browser sessions"""
     return profile_manager.camoufox_manager.get_active_sessions()
 
+@app.middleware("http")
+async def cache_frontend_script(request: Request, call_next):
+    """Let browsers cache the frontend script between page loads"""
+    response = await call_next(request)
+    if request.url.path == "/app.js":
+        response.headers["Cache-Control"] = "public, max-age=3600"
+    return response
+
+# Serve the frontend; mounted last so it doesn't shadow the API routes
+app.mount("/", StaticFiles(directory="../frontend", html=True), name="frontend")
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=12000)